@@ -0,0 +1,364 @@
+import asyncio
+import logging
+import time
+import aiohttp
+import orjson
+from typing import List, Optional, Dict, Any, Tuple
+
+from github_pr_manager import BRANCH_CACHE_TTL, JSON_HEADERS, _validation_message
+
+
+# A child of the sync manager's logger, so one logging setup covers both managers
+logger = logging.getLogger("github_pr_manager.async")
+
+
+class AsyncGitHubPRManager:
+    """
+    An asyncio version of GitHubPRManager built on aiohttp.
+    Lets many PR operations be in flight at once, e.g.:
+
+        async with AsyncGitHubPRManager(token, owner, repo) as manager:
+            await asyncio.gather(*[manager.create_pr_with_reviewers(**spec) for spec in specs])
+    """
+
+    def __init__(
+        self,
+        token: str,
+        owner: str,
+        repo: str,
+        base_url: str = "https://api.github.com",
+        connection_limit: int = 20
+    ):
+        """
+        Initializes the async GitHub PR manager.
+
+        Args:
+            token (str): GitHub Personal Access Token
+            owner (str): Repository owner (username or organization)
+            repo (str): Repository name
+            base_url (str): GitHub API base URL (default: https://api.github.com)
+            connection_limit (int): Maximum number of simultaneous connections (default: 20)
+        """
+        # Remove any whitespace from the token
+        self.token = token.strip()
+        self.owner = owner
+        self.repo = repo
+        self.base_url = base_url
+        # REST URL prefix shared by every repository endpoint
+        self._repo_url = f"{base_url}/repos/{owner}/{repo}"
+        self.connection_limit = connection_limit
+        # Check if the token starts with github_pat_
+        if not self.token.startswith('github_pat_'):
+            logger.warning("⚠️  Warning: Token does not start with 'github_pat_', it might not be loaded correctly")
+
+        # Additional token validation
+        if '"' in self.token or "'" in self.token:
+            raise ValueError("Token contains invalid characters (quotes or apostrophes)")
+
+        self.headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28"
+        }
+
+        # Created lazily, since aiohttp sessions must be created inside a running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Branch name -> (monotonic timestamp, exists); only positive results are stored
+        self._branch_cache: Dict[str, Tuple[float, bool]] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        The shared aiohttp session, created on first use.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.connection_limit)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Closes the underlying HTTP session and releases its pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncGitHubPRManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    @staticmethod
+    async def _raise_for_status(response: aiohttp.ClientResponse, action: str) -> None:
+        """
+        Logs the error details of a failed response and raises.
+
+        Args:
+            response (aiohttp.ClientResponse): The response to check
+            action (str): What was being done, used in the error message
+
+        Raises:
+            aiohttp.ClientResponseError: When the response has an error status
+        """
+        if response.status < 400:
+            return
+
+        logger.error("❌ Error %s: %s %s", action, response.status, response.reason)
+        try:
+            error_data = await response.json(loads=orjson.loads, content_type=None)
+            logger.error("📝 Error details: %s", error_data)
+        except Exception:
+            logger.error("📝 Server response: %s", await response.text())
+        response.raise_for_status()
+
+    def _branch_cached(self, branch_name: str) -> bool:
+        """
+        Returns True if the branch was recently confirmed to exist.
+        """
+        entry = self._branch_cache.get(branch_name)
+        return entry is not None and time.monotonic() - entry[0] < BRANCH_CACHE_TTL
+
+    def _remember_branch(self, branch_name: str) -> None:
+        """
+        Records that the branch exists.
+        """
+        self._branch_cache[branch_name] = (time.monotonic(), True)
+
+    def invalidate_branch_cache(self, branch_name: Optional[str] = None) -> None:
+        """
+        Forgets cached branch existence results.
+
+        Args:
+            branch_name (str, optional): The branch to forget; clears the whole cache if omitted
+        """
+        if branch_name is None:
+            self._branch_cache.clear()
+        else:
+            self._branch_cache.pop(branch_name, None)
+
+    async def check_branch_exists(self, branch_name: str) -> bool:
+        """
+        Checks if a branch exists in the GitHub repository.
+        Positive results are cached for BRANCH_CACHE_TTL seconds.
+
+        Args:
+            branch_name (str): The name of the branch to check
+
+        Returns:
+            bool: True if the branch exists, False otherwise
+        """
+        if self._branch_cached(branch_name):
+            return True
+
+        url = f"{self._repo_url}/branches/{branch_name}"
+
+        try:
+            async with self.session.head(url, allow_redirects=False) as response:
+                if response.status == 200:
+                    self._remember_branch(branch_name)
+                    return True
+                return False
+        except aiohttp.ClientError:
+            return False
+
+    async def validate_branches(self, head: str, base: str) -> None:
+        """
+        Checks concurrently if both branches (head and base) exist in the repository.
+        Raises an exception if either branch does not exist.
+
+        Args:
+            head (str): The name of the source branch
+            base (str): The name of the target branch
+
+        Raises:
+            ValueError: When a branch does not exist
+        """
+        head_exists, base_exists = await asyncio.gather(
+            self.check_branch_exists(head),
+            self.check_branch_exists(base)
+        )
+
+        if not head_exists:
+            raise ValueError(f"❌ Source branch '{head}' does not exist in the repository!")
+
+        if not base_exists:
+            raise ValueError(f"❌ Target branch '{base}' does not exist in the repository!")
+
+        logger.info("✅ Both branches exist in the repository!")
+
+    async def create_pull_request(
+        self,
+        title: str,
+        head: str,
+        base: str,
+        body: Optional[str] = None,
+        draft: bool = False,
+        validate: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Creates a new Pull Request.
+
+        Args:
+            title (str): The title of the Pull Request
+            head (str): The name of the branch to merge from
+            base (str): The name of the target branch (e.g., 'main', 'master')
+            body (str, optional): The description of the Pull Request
+            draft (bool): Whether the PR should be a draft
+            validate (bool): Whether to check that both branches exist before creating the PR.
+                Pass False when the branches are known to exist to save a round-trip;
+                a missing branch is then reported by the API itself.
+
+        Returns:
+            Dict[str, Any]: The response from the GitHub API with the created PR data
+
+        Raises:
+            aiohttp.ClientError: When an HTTP request error occurs
+            ValueError: When the API rejects the PR or a branch does not exist
+        """
+        # Check if branches exist before creating the PR
+        if validate:
+            await self.validate_branches(head, base)
+
+        url = f"{self._repo_url}/pulls"
+
+        data = {
+            "title": title,
+            "head": head,
+            "base": base,
+            "draft": draft
+        }
+
+        if body:
+            data["body"] = body
+
+        async with self.session.post(url, data=orjson.dumps(data), headers=JSON_HEADERS) as response:
+            # 422 means GitHub rejected the PR itself, e.g. a missing branch
+            if response.status == 422:
+                error_data = await response.json(loads=orjson.loads, content_type=None)
+                logger.error("📝 Error details: %s", error_data)
+                raise ValueError(f"❌ GitHub rejected the Pull Request: {_validation_message(error_data)}")
+            await self._raise_for_status(response, "creating PR")
+            pr_data = await response.json(loads=orjson.loads)
+
+        logger.info("✅ Pull Request created successfully!")
+        logger.info("📋 Title: %s", pr_data['title'])
+        logger.info("🔗 URL: %s", pr_data['html_url'])
+        logger.info("🆔 PR Number: #%s", pr_data['number'])
+
+        return pr_data
+
+    async def add_reviewers(
+        self,
+        pr_number: int,
+        reviewers: Optional[List[str]] = None,
+        team_reviewers: Optional[List[str]] = None,
+        minimal: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Adds reviewers to an existing Pull Request.
+        Users and teams are requested together in a single API call.
+
+        Args:
+            pr_number (int): The Pull Request number
+            reviewers (List[str], optional): A list of user usernames
+            team_reviewers (List[str], optional): A list of team names
+            minimal (bool): Skip decoding the response body and return only
+                {"status": "ok", "number": pr_number} (default: False)
+
+        Returns:
+            Dict[str, Any]: The response from the GitHub API
+
+        Raises:
+            aiohttp.ClientError: When an HTTP request error occurs
+            ValueError: When no reviewers are provided
+        """
+        if not reviewers and not team_reviewers:
+            raise ValueError("At least one reviewer or team must be provided")
+
+        url = f"{self._repo_url}/pulls/{pr_number}/requested_reviewers"
+
+        data: Dict[str, List[str]] = {"reviewers": reviewers} if reviewers else {}
+        if team_reviewers:
+            data["team_reviewers"] = team_reviewers
+
+        async with self.session.post(url, data=orjson.dumps(data), headers=JSON_HEADERS) as response:
+            await self._raise_for_status(response, "adding reviewers")
+            result = {"status": "ok", "number": pr_number} if minimal else await response.json(loads=orjson.loads)
+
+        logger.info("✅ Reviewers added successfully to PR #%s!", pr_number)
+
+        if reviewers:
+            logger.info("👥 Added reviewers: %s", ', '.join(reviewers))
+        if team_reviewers:
+            logger.info("🏢 Added teams: %s", ', '.join(team_reviewers))
+
+        return result
+
+    async def create_pr_with_reviewers(
+        self,
+        title: str,
+        head: str,
+        base: str,
+        body: Optional[str] = None,
+        draft: bool = False,
+        reviewers: Optional[List[str]] = None,
+        team_reviewers: Optional[List[str]] = None,
+        validate: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Creates a Pull Request and immediately adds reviewers to it.
+        User and team reviewers are requested together in a single follow-up request,
+        which is skipped entirely when neither is given.
+
+        Args:
+            title (str): The title of the Pull Request
+            head (str): The name of the source branch
+            base (str): The name of the target branch
+            body (str, optional): The description of the Pull Request
+            draft (bool): Whether the PR should be a draft
+            reviewers (List[str], optional): A list of reviewer usernames
+            team_reviewers (List[str], optional): A list of team names
+            validate (bool): Whether to check that both branches exist before creating the PR
+
+        Returns:
+            Dict[str, Any]: The created PR data with information about the reviewers
+        """
+        # First, create the PR
+        pr_data = await self.create_pull_request(title, head, base, body, draft, validate)
+        pr_number = pr_data['number']
+
+        # Then, add reviewers if provided
+        if reviewers or team_reviewers:
+            try:
+                await self.add_reviewers(pr_number, reviewers, team_reviewers, minimal=True)
+                pr_data['reviewers_added'] = True
+            except Exception as e:
+                logger.warning("⚠️  PR was created, but an error occurred while adding reviewers: %s", e)
+                pr_data['reviewers_added'] = False
+
+        return pr_data
+
+    async def get_pull_request(self, pr_number: int, minimal: bool = False) -> Dict[str, Any]:
+        """
+        Retrieves information about a Pull Request.
+
+        Args:
+            pr_number (int): The Pull Request number
+            minimal (bool): Skip decoding the response body and return only
+                {"status": "ok", "number": pr_number} (default: False)
+
+        Returns:
+            Dict[str, Any]: The Pull Request data
+        """
+        url = f"{self._repo_url}/pulls/{pr_number}"
+
+        async with self.session.get(url) as response:
+            await self._raise_for_status(response, "retrieving PR information")
+            if minimal:
+                return {"status": "ok", "number": pr_number}
+            return await response.json(loads=orjson.loads)
@@ -1,6 +1,118 @@
+import itertools
+import logging
+import threading
+import time
+import orjson
 import requests
-import json
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Union
+
+try:
+    import httpx
+except ImportError:  # HTTP/2 support is optional
+    httpx = None
+
+
+logger = logging.getLogger(__name__)
+
+# Exceptions raised by either HTTP backend
+REQUEST_ERRORS: Tuple[type, ...] = (requests.RequestException,)
+if httpx is not None:
+    REQUEST_ERRORS += (httpx.HTTPError,)
+
+
+# Request bodies are encoded with orjson, so the content type is set explicitly
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# How many times a 429 that is not caused by an exhausted token is retried
+RATE_LIMIT_RETRIES = 5
+
+# How long (in seconds) a branch that was found to exist is trusted without re-checking
+BRANCH_CACHE_TTL = 60.0
+
+
+# Looks up both refs of a PR in a single GraphQL round-trip
+BRANCHES_QUERY = """
+query($owner: String!, $repo: String!, $h: String!, $b: String!) {
+  repository(owner: $owner, name: $repo) {
+    head: ref(qualifiedName: $h) { name }
+    base: ref(qualifiedName: $b) { name }
+  }
+}
+"""
+
+# Resolves the repository's GraphQL node ID, needed to create PRs through GraphQL
+REPOSITORY_ID_QUERY = """
+query($owner: String!, $repo: String!) {
+  repository(owner: $owner, name: $repo) { id }
+}
+"""
+
+# Number of aliased createPullRequest mutations sent in one GraphQL request
+GRAPHQL_BATCH_SIZE = 25
+
+
+def _validation_message(error_data: Any) -> str:
+    """
+    Builds a readable message from a GitHub 422 (Validation Failed) response body.
+    """
+    if not isinstance(error_data, dict):
+        return str(error_data)
+
+    details = []
+    for error in error_data.get("errors") or []:
+        if isinstance(error, dict):
+            details.append(error.get("message") or f"{error.get('field')} {error.get('code')}")
+        else:
+            details.append(str(error))
+
+    message = error_data.get("message", "Validation Failed")
+    return f"{message}: {'; '.join(details)}" if details else message
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket used to cap the rate of outgoing requests.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initializes the token bucket.
+
+        Args:
+            rate (float): Number of tokens added per second
+            capacity (int): Maximum number of tokens the bucket can hold (burst size)
+
+        Raises:
+            ValueError: When rate is not positive or capacity is less than 1
+        """
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        if capacity < 1:
+            raise ValueError("Token bucket capacity must be at least 1")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Takes one token from the bucket, sleeping until one is available.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
 
 
 class GitHubPRManager:
@@ -9,49 +121,282 @@ class GitHubPRManager:
     Allows creating PRs and adding reviewers.
     """
 
-    def __init__(self, token: str, owner: str, repo: str, base_url: str = "https://api.github.com"):
+    def __init__(
+        self,
+        token: Union[str, Sequence[str]],
+        owner: str,
+        repo: str,
+        base_url: str = "https://api.github.com",
+        requests_per_minute: Optional[float] = 30,
+        burst: int = 30,
+        max_inflight: int = 10,
+        pool_maxsize: int = 10,
+        http2: bool = False,
+        verbose: bool = False
+    ):
         """
         Initializes the GitHub PR manager.
 
         Args:
-            token (str): GitHub Personal Access Token
+            token (str | Sequence[str]): GitHub Personal Access Token, or several tokens
+                to rotate between so that their rate limits add up
             owner (str): Repository owner (username or organization)
             repo (str): Repository name
             base_url (str): GitHub API base URL (default: https://api.github.com)
+            requests_per_minute (float, optional): Sustained request rate allowed by the client-side throttle
+                (default: 30); None or 0 disables the throttle
+            burst (int): Number of requests that may be sent at once before throttling kicks in,
+                at least 1 (default: 30)
+            max_inflight (int): Maximum number of requests running at the same time (default: 10)
+            pool_maxsize (int): Number of connections kept open per token (default: 10)
+            http2 (bool): Use an httpx HTTP/2 client instead of requests, so concurrent calls
+                are multiplexed over one connection (requires `httpx[http2]`)
+            verbose (bool): Log the token previews and API headers on startup (default: False)
         """
-        # Remove any whitespace from the token
-        self.token = token.strip()
+        # Remove any whitespace from the tokens
+        tokens = [token] if isinstance(token, str) else list(token)
+        self._tokens = [t.strip() for t in tokens]
+        if not self._tokens:
+            raise ValueError("At least one token must be provided")
+        self.token = self._tokens[0]
         self.owner = owner
         self.repo = repo
         self.base_url = base_url
-        # Check if the token starts with github_pat_
-        if not self.token.startswith('github_pat_'):
-            print("⚠️  Warning: Token does not start with 'github_pat_', it might not be loaded correctly")
-
-        # Additional token validation
-        if '"' in self.token or "'" in self.token:
-            raise ValueError("Token contains invalid characters (quotes or apostrophes)")
+        # REST URL prefix shared by every repository endpoint
+        self._repo_url = f"{base_url}/repos/{owner}/{repo}"
+        # GitHub Enterprise serves GraphQL at /api/graphql next to the /api/v3 REST root
+        if base_url.rstrip("/").endswith("/v3"):
+            self.graphql_url = f"{base_url.rstrip('/')[:-3]}/graphql"
+        else:
+            self.graphql_url = f"{base_url}/graphql"
+
+        for t in self._tokens:
+            # Check if the token starts with github_pat_
+            if not t.startswith('github_pat_'):
+                logger.warning("⚠️  Warning: Token does not start with 'github_pat_', it might not be loaded correctly")
+
+            # Additional token validation
+            if '"' in t or "'" in t:
+                raise ValueError("Token contains invalid characters (quotes or apostrophes)")
 
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/vnd.github+json",  # Update Accept header
-            "X-GitHub-Api-Version": "2022-11-28",    # Add API version
-            "Content-Type": "application/json"
+            "X-GitHub-Api-Version": "2022-11-28"     # Add API version
         }
 
         # Debug information about headers (hide most of the token)
-        token_preview = f"{token[:15]}...{token[-5:]}" if len(token) > 20 else token
-        print(f"🔐 Using token: {token_preview}")
-        print("📡 API Headers:")
-        for key, value in self.headers.items():
-            if key == "Authorization":
-                print(f"   {key}: Bearer {token_preview}")
+        if verbose:
+            token_previews = [f"{t[:15]}...{t[-5:]}" if len(t) > 20 else "***" for t in self._tokens]
+            for token_preview in token_previews:
+                logger.info("🔐 Using token: %s", token_preview)
+            logger.info("📡 API Headers:")
+            for key, value in self.headers.items():
+                if key == "Authorization":
+                    logger.info("   %s: Bearer %s", key, token_previews[0])
+                else:
+                    logger.info("   %s: %s", key, value)
+
+        self.http2 = http2
+        self.pool_maxsize = pool_maxsize
+        if http2 and httpx is None:
+            raise ImportError("HTTP/2 support requires httpx: pip install 'httpx[http2]'")
+
+        # One Session per token keeps each token's TLS connections alive between calls,
+        # and transient 5xx errors are retried with exponential backoff. 429 is left to
+        # _request, which can switch to another token instead of retrying an exhausted one.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["HEAD", "GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # Sessions without status retries, for requests that must not be sent twice
+        # (a 5xx can arrive after GitHub has already carried out a mutation)
+        no_status_retry = Retry(total=3, read=False, status_forcelist=(), raise_on_status=False)
+        self._sessions: List[Any] = []
+        self._no_retry_sessions: List[Any] = []
+        for t in self._tokens:
+            session_headers = {**self.headers, "Authorization": f"Bearer {t}"}
+            if http2:
+                # httpx only retries failed connections; status-based retries are not available here
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(max_keepalive_connections=pool_maxsize)
+                )
+                client = httpx.Client(headers=session_headers, transport=transport)
+                self._sessions.append(client)
+                self._no_retry_sessions.append(client)
             else:
-                print(f"   {key}: {value}")
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize, max_retries=retry)
+                session = requests.Session()
+                session.headers.update(session_headers)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions.append(session)
+
+                no_retry_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize, max_retries=no_status_retry)
+                no_retry_session = requests.Session()
+                no_retry_session.headers.update(session_headers)
+                no_retry_session.mount("https://", no_retry_adapter)
+                no_retry_session.mount("http://", no_retry_adapter)
+                self._no_retry_sessions.append(no_retry_session)
+        self.session = self._sessions[0]
+
+        # Tokens are used round-robin; a token whose quota ran out is skipped until its reset time
+        self._tok_idx = itertools.cycle(range(len(self._tokens)))
+        self._tok_lock = threading.Lock()
+        self._exhausted_until = [0.0] * len(self._tokens)
+
+        # Smooth the request rate and cap concurrency to stay clear of GitHub's secondary rate limits
+        self._limiter: Optional[TokenBucket] = None
+        if requests_per_minute:
+            self._limiter = TokenBucket(rate=requests_per_minute / 60.0, capacity=burst)
+        self._inflight = threading.Semaphore(max_inflight)
+
+        # GraphQL node ID of the repository, resolved on first use
+        self._repository_id: Optional[str] = None
+
+        # Branch name -> (monotonic timestamp, exists); only positive results are stored
+        self._branch_cache: Dict[str, Tuple[float, bool]] = {}
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP sessions and releases their pooled connections.
+        """
+        for session in {id(s): s for s in self._sessions + self._no_retry_sessions}.values():
+            session.close()
+
+    def __enter__(self) -> "GitHubPRManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _next_token_index(self) -> int:
+        """
+        Picks the next token in round-robin order, skipping tokens whose rate limit is exhausted.
+        """
+        with self._tok_lock:
+            now = time.time()
+            for _ in range(len(self._tokens)):
+                idx = next(self._tok_idx)
+                if self._exhausted_until[idx] <= now:
+                    return idx
+            # Every token is exhausted: let the API answer for the next one in line
+            return next(self._tok_idx)
+
+    def _request(self, method: str, url: str, retry_on_status: bool = True, **kwargs: Any) -> requests.Response:
+        """
+        Sends a request using the next token from the pool, after waiting
+        for the client-side throttle.
+        When GitHub reports that the token's rate limit is used up, the request
+        is repeated immediately with the remaining tokens instead of waiting;
+        other 429 responses are retried after the delay GitHub asks for.
+
+        Args:
+            method (str): The HTTP method
+            url (str): The request URL
+            retry_on_status (bool): Whether 5xx responses may be retried automatically;
+                pass False for requests that must not be repeated, such as mutations
+            **kwargs: Extra arguments passed to requests.Session.request (or httpx.Client.request)
+
+        Returns:
+            requests.Response: The response from the GitHub API (an httpx.Response with http2=True)
+
+        Raises:
+            requests.RequestException: When an HTTP request error occurs (httpx.HTTPError with http2=True)
+        """
+        if self.http2 and "allow_redirects" in kwargs:
+            kwargs["follow_redirects"] = kwargs.pop("allow_redirects")
+
+        sessions = self._sessions if retry_on_status else self._no_retry_sessions
+        rotations = 0
+        backoffs = 0
+        while True:
+            idx = self._next_token_index()
+            if self._limiter is not None:
+                self._limiter.acquire()
+            with self._inflight:
+                response = sessions[idx].request(method, url, **kwargs)
+
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                # The token's quota is used up: skip it until reset and try the next one
+                reset = response.headers.get("X-RateLimit-Reset")
+                with self._tok_lock:
+                    self._exhausted_until[idx] = float(reset) if reset and reset.isdigit() else time.time() + 60
+                if response.status_code in (403, 429) and rotations < len(self._tokens) - 1:
+                    rotations += 1
+                    continue
+                return response
+
+            if response.status_code == 429 and backoffs < RATE_LIMIT_RETRIES:
+                # Secondary rate limit: wait as instructed (or back off exponentially) and retry
+                retry_after = response.headers.get("Retry-After")
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else 0.5 * 2 ** backoffs
+                backoffs += 1
+                time.sleep(delay)
+                continue
+
+            return response
+
+    def _post_json(self, url: str, data: Any, retry_on_status: bool = True) -> requests.Response:
+        """
+        Sends a POST request with a JSON body encoded by orjson.
+
+        Args:
+            url (str): The request URL
+            data (Any): The object to send as JSON
+            retry_on_status (bool): Whether 5xx responses may be retried automatically
+
+        Returns:
+            requests.Response: The response from the GitHub API
+
+        Raises:
+            requests.RequestException: When an HTTP request error occurs
+        """
+        # httpx expects raw bytes as `content`, requests as `data`
+        body_arg = "content" if self.http2 else "data"
+        return self._request(
+            "POST",
+            url,
+            retry_on_status=retry_on_status,
+            headers=JSON_HEADERS,
+            **{body_arg: orjson.dumps(data)}
+        )
+
+    def _branch_cached(self, branch_name: str) -> bool:
+        """
+        Returns True if the branch was recently confirmed to exist.
+        """
+        entry = self._branch_cache.get(branch_name)
+        return entry is not None and time.monotonic() - entry[0] < BRANCH_CACHE_TTL
+
+    def _remember_branch(self, branch_name: str) -> None:
+        """
+        Records that the branch exists.
+        """
+        self._branch_cache[branch_name] = (time.monotonic(), True)
+
+    def invalidate_branch_cache(self, branch_name: Optional[str] = None) -> None:
+        """
+        Forgets cached branch existence results.
+
+        Args:
+            branch_name (str, optional): The branch to forget; clears the whole cache if omitted
+        """
+        if branch_name is None:
+            self._branch_cache.clear()
+        else:
+            self._branch_cache.pop(branch_name, None)
 
     def check_branch_exists(self, branch_name: str) -> bool:
         """
         Checks if a branch exists in the GitHub repository.
+        Positive results are cached for BRANCH_CACHE_TTL seconds.
 
         Args:
             branch_name (str): The name of the branch to check
@@ -59,17 +404,71 @@ class GitHubPRManager:
         Returns:
             bool: True if the branch exists, False otherwise
         """
-        url = f"{self.base_url}/repos/{self.owner}/{self.repo}/branches/{branch_name}"
+        if self._branch_cached(branch_name):
+            return True
+
+        url = f"{self._repo_url}/branches/{branch_name}"
 
         try:
-            response = requests.get(url, headers=self.headers)
-            return response.status_code == 200
-        except requests.RequestException:
+            # HEAD is enough to tell 200 from 404 without downloading the branch metadata
+            response = self._request("HEAD", url, allow_redirects=False)
+            if response.status_code == 200:
+                self._remember_branch(branch_name)
+                return True
+            return False
+        except REQUEST_ERRORS:
             return False
 
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executes a GraphQL query against the GitHub API.
+
+        Args:
+            query (str): The GraphQL document
+            variables (Dict[str, Any]): The query variables
+
+        Returns:
+            Dict[str, Any]: The "data" member of the GraphQL response
+
+        Raises:
+            requests.RequestException: When an HTTP request error occurs
+            ValueError: When the API returns GraphQL errors
+        """
+        result = self._graphql_result(query, variables)
+        if result.get("errors"):
+            messages = "; ".join(error.get("message", str(error)) for error in result["errors"])
+            raise ValueError(f"❌ GraphQL error: {messages}")
+
+        return result.get("data") or {}
+
+    def _graphql_result(
+        self,
+        query: str,
+        variables: Dict[str, Any],
+        retry_on_status: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Executes a GraphQL query and returns the whole response, including any "errors".
+
+        Args:
+            query (str): The GraphQL document
+            variables (Dict[str, Any]): The query variables
+            retry_on_status (bool): Whether 5xx responses may be retried automatically
+
+        Returns:
+            Dict[str, Any]: The decoded GraphQL response
+
+        Raises:
+            requests.RequestException: When an HTTP request error occurs
+        """
+        response = self._post_json(self.graphql_url, {"query": query, "variables": variables}, retry_on_status)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     def validate_branches(self, head: str, base: str) -> None:
         """
-        Checks if both branches (head and base) exist in the repository.
+        Checks if both branches (head and base) exist in the repository
+        using a single GraphQL query, skipped when both are already cached.
         Raises an exception if either branch does not exist.
 
         Args:
@@ -77,15 +476,35 @@ class GitHubPRManager:
             base (str): The name of the target branch
 
         Raises:
+            requests.RequestException: When an HTTP request error occurs
             ValueError: When a branch does not exist
         """
-        if not self.check_branch_exists(head):
+        if self._branch_cached(head) and self._branch_cached(base):
+            logger.info("✅ Both branches exist in the repository!")
+            return
+
+        data = self._graphql(BRANCHES_QUERY, {
+            "owner": self.owner,
+            "repo": self.repo,
+            "h": f"refs/heads/{head}",
+            "b": f"refs/heads/{base}"
+        })
+        repository = data.get("repository") or {}
+        head_exists = repository.get("head") is not None
+        base_exists = repository.get("base") is not None
+
+        if head_exists:
+            self._remember_branch(head)
+        if base_exists:
+            self._remember_branch(base)
+
+        if not head_exists:
             raise ValueError(f"❌ Source branch '{head}' does not exist in the repository!")
 
-        if not self.check_branch_exists(base):
+        if not base_exists:
             raise ValueError(f"❌ Target branch '{base}' does not exist in the repository!")
 
-        print("✅ Both branches exist in the repository!")
+        logger.info("✅ Both branches exist in the repository!")
 
     def create_pull_request(
         self,
@@ -93,7 +512,8 @@ class GitHubPRManager:
         head: str,
         base: str,
         body: Optional[str] = None,
-        draft: bool = False
+        draft: bool = False,
+        validate: bool = True
     ) -> Dict[str, Any]:
         """
         Creates a new Pull Request.
@@ -104,6 +524,9 @@ class GitHubPRManager:
             base (str): The name of the target branch (e.g., 'main', 'master')
             body (str, optional): The description of the Pull Request
             draft (bool): Whether the PR should be a draft
+            validate (bool): Whether to check that both branches exist before creating the PR.
+                Pass False when the branches are known to exist to save a round-trip;
+                a missing branch is then reported by the API itself.
 
         Returns:
             Dict[str, Any]: The response from the GitHub API with the created PR data
@@ -113,9 +536,10 @@ class GitHubPRManager:
             ValueError: When the API returns an error or a branch does not exist
         """
         # Check if branches exist before creating the PR
-        self.validate_branches(head, base)
+        if validate:
+            self.validate_branches(head, base)
 
-        url = f"{self.base_url}/repos/{self.owner}/{self.repo}/pulls"
+        url = f"{self._repo_url}/pulls"
 
         data = {
             "title": title,
@@ -128,40 +552,49 @@ class GitHubPRManager:
             data["body"] = body
 
         try:
-            response = requests.post(url, headers=self.headers, data=json.dumps(data))
+            response = self._post_json(url, data)
             response.raise_for_status()
 
-            pr_data = response.json()
-            print("✅ Pull Request created successfully!")
-            print(f"📋 Title: {pr_data['title']}")
-            print(f"🔗 URL: {pr_data['html_url']}")
-            print(f"🆔 PR Number: #{pr_data['number']}")
+            pr_data = orjson.loads(response.content)
+            logger.info("✅ Pull Request created successfully!")
+            logger.info("📋 Title: %s", pr_data['title'])
+            logger.info("🔗 URL: %s", pr_data['html_url'])
+            logger.info("🆔 PR Number: #%s", pr_data['number'])
 
             return pr_data
 
-        except requests.RequestException as e:
-            print(f"❌ Error creating PR: {e}")
+        except REQUEST_ERRORS as e:
+            logger.error("❌ Error creating PR: %s", e)
             if hasattr(e, 'response') and e.response is not None:
+                error_data = None
                 try:
-                    error_data = e.response.json()
-                    print(f"📝 Error details: {error_data}")
+                    error_data = orjson.loads(e.response.content)
+                    logger.error("📝 Error details: %s", error_data)
                 except Exception:
-                    print(f"📝 Server response: {e.response.text}")
+                    logger.error("📝 Server response: %s", e.response.text)
+
+                # 422 means GitHub rejected the PR itself, e.g. a missing branch
+                if e.response.status_code == 422 and error_data is not None:
+                    raise ValueError(f"❌ GitHub rejected the Pull Request: {_validation_message(error_data)}") from e
             raise
 
     def add_reviewers(
         self,
         pr_number: int,
         reviewers: Optional[List[str]] = None,
-        team_reviewers: Optional[List[str]] = None
+        team_reviewers: Optional[List[str]] = None,
+        minimal: bool = False
     ) -> Dict[str, Any]:
         """
         Adds reviewers to an existing Pull Request.
+        Users and teams are requested together in a single API call.
 
         Args:
             pr_number (int): The Pull Request number
             reviewers (List[str], optional): A list of user usernames
             team_reviewers (List[str], optional): A list of team names
+            minimal (bool): Skip decoding the response body and return only
+                {"status": "ok", "number": pr_number} (default: False)
 
         Returns:
             Dict[str, Any]: The response from the GitHub API
@@ -173,36 +606,34 @@ class GitHubPRManager:
         if not reviewers and not team_reviewers:
             raise ValueError("At least one reviewer or team must be provided")
 
-        url = f"{self.base_url}/repos/{self.owner}/{self.repo}/pulls/{pr_number}/requested_reviewers"
+        url = f"{self._repo_url}/pulls/{pr_number}/requested_reviewers"
 
-        data = {}
-        if reviewers:
-            data["reviewers"] = reviewers
+        data: Dict[str, List[str]] = {"reviewers": reviewers} if reviewers else {}
         if team_reviewers:
             data["team_reviewers"] = team_reviewers
 
         try:
-            response = requests.post(url, headers=self.headers, data=json.dumps(data))
+            response = self._post_json(url, data)
             response.raise_for_status()
 
-            result = response.json()
-            print(f"✅ Reviewers added successfully to PR #{pr_number}!")
+            result = {"status": "ok", "number": pr_number} if minimal else orjson.loads(response.content)
+            logger.info("✅ Reviewers added successfully to PR #%s!", pr_number)
 
             if reviewers:
-                print(f"👥 Added reviewers: {', '.join(reviewers)}")
+                logger.info("👥 Added reviewers: %s", ', '.join(reviewers))
             if team_reviewers:
-                print(f"🏢 Added teams: {', '.join(team_reviewers)}")
+                logger.info("🏢 Added teams: %s", ', '.join(team_reviewers))
 
             return result
 
-        except requests.RequestException as e:
-            print(f"❌ Error adding reviewers: {e}")
+        except REQUEST_ERRORS as e:
+            logger.error("❌ Error adding reviewers: %s", e)
             if hasattr(e, 'response') and e.response is not None:
                 try:
-                    error_data = e.response.json()
-                    print(f"📝 Error details: {error_data}")
+                    error_data = orjson.loads(e.response.content)
+                    logger.error("📝 Error details: %s", error_data)
                 except Exception:
-                    print(f"📝 Server response: {e.response.text}")
+                    logger.error("📝 Server response: %s", e.response.text)
             raise
 
     def create_pr_with_reviewers(
@@ -213,10 +644,13 @@ class GitHubPRManager:
         body: Optional[str] = None,
         draft: bool = False,
         reviewers: Optional[List[str]] = None,
-        team_reviewers: Optional[List[str]] = None
+        team_reviewers: Optional[List[str]] = None,
+        validate: bool = True
     ) -> Dict[str, Any]:
         """
         Creates a Pull Request and immediately adds reviewers to it.
+        User and team reviewers are requested together in a single follow-up request,
+        which is skipped entirely when neither is given.
 
         Args:
             title (str): The title of the Pull Request
@@ -226,42 +660,177 @@ class GitHubPRManager:
             draft (bool): Whether the PR should be a draft
             reviewers (List[str], optional): A list of reviewer usernames
             team_reviewers (List[str], optional): A list of team names
+            validate (bool): Whether to check that both branches exist before creating the PR
 
         Returns:
             Dict[str, Any]: The created PR data with information about the reviewers
         """
         # First, create the PR
-        pr_data = self.create_pull_request(title, head, base, body, draft)
+        pr_data = self.create_pull_request(title, head, base, body, draft, validate)
         pr_number = pr_data['number']
 
         # Then, add reviewers if provided
         if reviewers or team_reviewers:
             try:
-                self.add_reviewers(pr_number, reviewers, team_reviewers)
+                self.add_reviewers(pr_number, reviewers, team_reviewers, minimal=True)
                 pr_data['reviewers_added'] = True
             except Exception as e:
-                print(f"⚠️  PR was created, but an error occurred while adding reviewers: {e}")
+                logger.warning("⚠️  PR was created, but an error occurred while adding reviewers: %s", e)
                 pr_data['reviewers_added'] = False
 
         return pr_data
 
-    def get_pull_request(self, pr_number: int) -> Dict[str, Any]:
+    def create_pull_requests(self, specs: List[Dict[str, Any]], max_workers: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """
+        Creates several Pull Requests concurrently using a pool of threads.
+        The request rate and concurrency stay capped by the client-side throttle.
+        A failing spec does not stop the others; its error is logged instead.
+
+        Args:
+            specs (List[Dict[str, Any]]): Keyword arguments for create_pr_with_reviewers, one dict per PR
+            max_workers (int): Maximum number of PRs created at the same time (default: 8),
+                limited to the connection pool size
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: For each spec, in order, the created PR data,
+                or None if that PR could not be created
+        """
+        if not specs:
+            return []
+
+        # More threads than pooled connections would only open throwaway connections
+        max_workers = max(1, min(max_workers, self.pool_maxsize, len(specs)))
+
+        results: List[Optional[Dict[str, Any]]] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.create_pr_with_reviewers, **spec) for spec in specs]
+            for spec, future in zip(specs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error("❌ Error creating PR '%s': %s", spec.get("title"), e)
+                    results.append(None)
+
+        return results
+
+    def _get_repository_id(self) -> str:
+        """
+        Returns the GraphQL node ID of the repository, fetching it once.
+        """
+        if self._repository_id is None:
+            data = self._graphql(REPOSITORY_ID_QUERY, {"owner": self.owner, "repo": self.repo})
+            self._repository_id = data["repository"]["id"]
+        return self._repository_id
+
+    def create_pull_requests_graphql(self, specs: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Creates several Pull Requests with batched GraphQL mutations, sending up to
+        GRAPHQL_BATCH_SIZE PRs per request. Reviewers given in a spec are then
+        requested through the REST API.
+
+        Args:
+            specs (List[Dict[str, Any]]): One dict per PR with the keys title, head, base and
+                optionally body, draft, reviewers and team_reviewers
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: For each spec, in order, a dict with the PR's
+                number, html_url and node_id, or None if that PR could not be created.
+                A batch whose request fails is logged and yields None for each of its specs.
+
+        Raises:
+            requests.RequestException: When an HTTP request error occurs while resolving the repository
+            ValueError: When the repository cannot be resolved
+        """
+        if not specs:
+            return []
+
+        repository_id = self._get_repository_id()
+        results: List[Optional[Dict[str, Any]]] = []
+
+        for start in range(0, len(specs), GRAPHQL_BATCH_SIZE):
+            batch = specs[start:start + GRAPHQL_BATCH_SIZE]
+
+            variables = {}
+            for i, spec in enumerate(batch):
+                pr_input = {
+                    "repositoryId": repository_id,
+                    "title": spec["title"],
+                    "headRefName": spec["head"],
+                    "baseRefName": spec["base"],
+                    "draft": spec.get("draft", False)
+                }
+                if spec.get("body"):
+                    pr_input["body"] = spec["body"]
+                variables[f"input{i}"] = pr_input
+
+            declarations = ", ".join(f"$input{i}: CreatePullRequestInput!" for i in range(len(batch)))
+            mutations = " ".join(
+                f"pr{i}: createPullRequest(input: $input{i}) {{ pullRequest {{ id number url }} }}"
+                for i in range(len(batch))
+            )
+            try:
+                # Not retried on 5xx: a retry after GitHub already created the PRs would
+                # only fail with "A pull request already exists" for every alias
+                result = self._graphql_result(
+                    f"mutation({declarations}) {{ {mutations} }}",
+                    variables,
+                    retry_on_status=False
+                )
+            except REQUEST_ERRORS + (ValueError,) as e:
+                # Earlier batches were already created, so report this one as failed and carry on
+                logger.error("❌ Error creating PRs %d-%d: %s", start + 1, start + len(batch), e)
+                results.extend([None] * len(batch))
+                continue
+
+            for error in result.get("errors") or []:
+                alias = (error.get("path") or ["?"])[0]
+                logger.error("❌ Error creating PR (%s): %s", alias, error.get("message", error))
+
+            data = result.get("data") or {}
+            for i, spec in enumerate(batch):
+                created = (data.get(f"pr{i}") or {}).get("pullRequest")
+                if created is None:
+                    results.append(None)
+                    continue
+
+                pr_data = {"number": created["number"], "html_url": created["url"], "node_id": created["id"]}
+                logger.info("✅ Pull Request created successfully: %s", pr_data['html_url'])
+
+                reviewers = spec.get("reviewers")
+                team_reviewers = spec.get("team_reviewers")
+                if reviewers or team_reviewers:
+                    try:
+                        self.add_reviewers(pr_data["number"], reviewers, team_reviewers, minimal=True)
+                        pr_data['reviewers_added'] = True
+                    except Exception as e:
+                        logger.warning("⚠️  PR was created, but an error occurred while adding reviewers: %s", e)
+                        pr_data['reviewers_added'] = False
+
+                results.append(pr_data)
+
+        return results
+
+    def get_pull_request(self, pr_number: int, minimal: bool = False) -> Dict[str, Any]:
         """
         Retrieves information about a Pull Request.
 
         Args:
             pr_number (int): The Pull Request number
+            minimal (bool): Skip decoding the response body and return only
+                {"status": "ok", "number": pr_number} (default: False)
 
         Returns:
             Dict[str, Any]: The Pull Request data
         """
-        url = f"{self.base_url}/repos/{self.owner}/{self.repo}/pulls/{pr_number}"
+        url = f"{self._repo_url}/pulls/{pr_number}"
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._request("GET", url)
             response.raise_for_status()
-            return response.json()
+            if minimal:
+                return {"status": "ok", "number": pr_number}
+            return orjson.loads(response.content)
 
-        except requests.RequestException as e:
-            print(f"❌ Error retrieving PR information: {e}")
+        except REQUEST_ERRORS as e:
+            logger.error("❌ Error retrieving PR information: %s", e)
             raise
\ No newline at end of file
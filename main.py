@@ -3,6 +3,7 @@
 Example of using GitHubPRManager - a class for creating Pull Requests in GitHub.
 """
 
+import logging
 import os
 from dotenv import load_dotenv
 from github_pr_manager import GitHubPRManager
@@ -10,6 +11,9 @@ from github_pr_manager import GitHubPRManager
 # Load environment variables from .env file, overwriting existing ones
 load_dotenv(override=True)
 
+# Show the progress messages logged by GitHubPRManager
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 
 def main():
     """Main function demonstrating the use of GitHubPRManager."""
@@ -36,7 +40,8 @@ def main():
         token=GITHUB_TOKEN,
         owner=GITHUB_OWNER,
         repo=GITHUB_REPO,
-        base_url=GITHUB_API_URL
+        base_url=GITHUB_API_URL,
+        verbose=True  # Log the token preview and API headers
     )
 
     print("🚀 GitHubPRManager - Pull Request Creation Demo")
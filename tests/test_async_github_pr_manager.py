@@ -0,0 +1,135 @@
+import os
+import sys
+import unittest
+
+import aiohttp
+import orjson
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_github_pr_manager import AsyncGitHubPRManager  # noqa: E402
+
+
+TOKEN = "github_pat_" + "a" * 30
+
+
+class StubResponse:
+    """
+    Stands in for aiohttp.ClientResponse, carrying a JSON body.
+    """
+
+    def __init__(self, status, body=None):
+        self.status = status
+        self.reason = "Stub"
+        self._body = orjson.dumps(body) if body is not None else b""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return None
+
+    async def json(self, loads=orjson.loads, content_type="application/json"):
+        return loads(self._body)
+
+    async def text(self):
+        return self._body.decode()
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(None, (), status=self.status, message=self.reason)
+
+
+class StubSession:
+    """
+    Stands in for aiohttp.ClientSession, answering each call through a handler.
+    """
+
+    closed = False
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def _call(self, method, url, data=None, **kwargs):
+        payload = orjson.loads(data) if data else None
+        self.calls.append((method, url, payload))
+        return self.handler(method, url, payload)
+
+    def head(self, url, **kwargs):
+        return self._call("HEAD", url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self._call("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._call("POST", url, **kwargs)
+
+    async def close(self):
+        self.closed = True
+
+
+def make_manager(handler):
+    """
+    Creates an AsyncGitHubPRManager whose session is replaced by a StubSession.
+    """
+    manager = AsyncGitHubPRManager(TOKEN, "owner", "repo")
+    manager._session = StubSession(handler)
+    return manager
+
+
+class BranchCacheTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_existing_branch_is_cached_until_invalidated(self):
+        manager = make_manager(lambda method, url, payload: StubResponse(200))
+
+        self.assertTrue(await manager.check_branch_exists("main"))
+        self.assertTrue(await manager.check_branch_exists("main"))
+        self.assertEqual(len(manager._session.calls), 1)
+
+        manager.invalidate_branch_cache("main")
+        self.assertTrue(await manager.check_branch_exists("main"))
+        self.assertEqual(len(manager._session.calls), 2)
+
+    async def test_missing_branch_is_not_cached(self):
+        manager = make_manager(lambda method, url, payload: StubResponse(404))
+
+        self.assertFalse(await manager.check_branch_exists("feature"))
+        self.assertFalse(await manager.check_branch_exists("feature"))
+        self.assertEqual(len(manager._session.calls), 2)
+
+
+class CreatePullRequestTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_logs_under_the_sync_managers_logger(self):
+        manager = make_manager(lambda method, url, payload: StubResponse(200))
+
+        with self.assertLogs("github_pr_manager", level="INFO"):
+            await manager.validate_branches("feature", "main")
+
+    async def test_creates_pr_and_requests_reviewers(self):
+        def handler(method, url, payload):
+            if method == "HEAD":
+                return StubResponse(200)
+            if url.endswith("/pulls"):
+                return StubResponse(201, {"number": 3, "title": payload["title"], "html_url": "https://github.com/o/r/pull/3"})
+            return StubResponse(201, {"users": []})
+
+        manager = make_manager(handler)
+        pr_data = await manager.create_pr_with_reviewers("T", "feature", "main", reviewers=["octocat"])
+
+        self.assertEqual(pr_data["number"], 3)
+        self.assertTrue(pr_data["reviewers_added"])
+        self.assertEqual(manager._session.calls[-1][2], {"reviewers": ["octocat"]})
+
+    async def test_rejected_pr_raises_value_error(self):
+        manager = make_manager(lambda method, url, payload: StubResponse(
+            422, {"message": "Validation Failed", "errors": [{"message": "head invalid"}]}
+        ))
+
+        with self.assertRaises(ValueError):
+            await manager.create_pull_request("T", "missing", "main", validate=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
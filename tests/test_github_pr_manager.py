@@ -0,0 +1,198 @@
+import os
+import sys
+import unittest
+
+import orjson
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from github_pr_manager import GitHubPRManager, TokenBucket  # noqa: E402
+
+
+TOKEN = "github_pat_" + "a" * 30
+
+
+def make_response(status_code, body=None, headers=None):
+    """
+    Builds a requests.Response carrying a JSON body.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = orjson.dumps(body) if body is not None else b""
+    response.headers.update(headers or {})
+    response.url = "https://api.github.com/stub"
+    return response
+
+
+class StubSession:
+    """
+    Stands in for requests.Session, answering each call through a handler.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        body = kwargs.get("data")
+        payload = orjson.loads(body) if body else None
+        self.calls.append((method, url, payload))
+        return self.handler(method, url, payload)
+
+    def close(self):
+        pass
+
+
+def make_manager(handler, tokens=TOKEN, **kwargs):
+    """
+    Creates a GitHubPRManager whose sessions are replaced by StubSessions.
+    """
+    manager = GitHubPRManager(tokens, "owner", "repo", **kwargs)
+    manager._sessions = [StubSession(handler) for _ in manager._sessions]
+    manager._no_retry_sessions = manager._sessions
+    return manager
+
+
+class TokenRotationTest(unittest.TestCase):
+
+    def test_exhausted_token_is_skipped_on_429(self):
+        exhausted = make_response(429, {"message": "API rate limit exceeded"}, {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "4102444800"
+        })
+        manager = GitHubPRManager([TOKEN, "github_pat_" + "b" * 30], "owner", "repo")
+        manager._sessions = [
+            StubSession(lambda method, url, payload: exhausted),
+            StubSession(lambda method, url, payload: make_response(200, {"number": 7}))
+        ]
+
+        self.assertEqual(manager.get_pull_request(7), {"number": 7})
+        self.assertEqual(len(manager._sessions[0].calls), 1)
+        self.assertEqual(len(manager._sessions[1].calls), 1)
+        self.assertEqual(manager._exhausted_until[0], 4102444800.0)
+
+        # The exhausted token is not used again until its reset time
+        manager.get_pull_request(7)
+        self.assertEqual(len(manager._sessions[0].calls), 1)
+
+    def test_adapter_leaves_429_to_the_manager(self):
+        manager = GitHubPRManager(TOKEN, "owner", "repo")
+        retry = manager.session.get_adapter("https://api.github.com").max_retries
+
+        self.assertNotIn(429, retry.status_forcelist)
+        self.assertFalse(retry.raise_on_status)
+        manager.close()
+
+
+class ThrottleTest(unittest.TestCase):
+
+    def test_zero_rate_disables_the_throttle(self):
+        manager = make_manager(lambda method, url, payload: make_response(200, {}), requests_per_minute=0, burst=1)
+
+        for _ in range(3):
+            manager.get_pull_request(1)
+        self.assertEqual(len(manager._sessions[0].calls), 3)
+
+    def test_token_bucket_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+    def test_token_bucket_rejects_empty_capacity(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, capacity=0)
+        with self.assertRaises(ValueError):
+            GitHubPRManager(TOKEN, "owner", "repo", burst=0)
+
+
+class CreatePullRequestsTest(unittest.TestCase):
+
+    def test_failed_spec_does_not_discard_other_results(self):
+        def handler(method, url, payload):
+            if payload["head"] == "missing":
+                return make_response(422, {"message": "Validation Failed", "errors": [{"message": "head invalid"}]})
+            return make_response(201, {"number": 1, "title": payload["title"], "html_url": "https://github.com/o/r/pull/1"})
+
+        manager = make_manager(handler)
+        results = manager.create_pull_requests([
+            {"title": "A", "head": "a", "base": "main", "validate": False},
+            {"title": "B", "head": "missing", "base": "main", "validate": False},
+            {"title": "C", "head": "c", "base": "main", "validate": False}
+        ])
+
+        self.assertEqual([r and r["title"] for r in results], ["A", None, "C"])
+
+
+class CreatePullRequestsGraphQLTest(unittest.TestCase):
+
+    def test_creates_prs_and_aligns_results_with_specs(self):
+        def handler(method, url, payload):
+            if not url.endswith("/graphql"):
+                return make_response(201, {"users": []})
+            if not payload["query"].startswith("mutation"):
+                return make_response(200, {"data": {"repository": {"id": "R_1"}}})
+            return make_response(200, {
+                "data": {
+                    "pr0": {"pullRequest": {"id": "PR_1", "number": 1, "url": "https://github.com/o/r/pull/1"}},
+                    "pr1": None
+                },
+                "errors": [{"path": ["pr1"], "message": "Head sha can't be blank"}]
+            })
+
+        manager = make_manager(handler)
+        results = manager.create_pull_requests_graphql([
+            {"title": "A", "head": "a", "base": "main", "reviewers": ["octocat"]},
+            {"title": "B", "head": "missing", "base": "main"}
+        ])
+
+        self.assertEqual(results[0]["number"], 1)
+        self.assertEqual(results[0]["node_id"], "PR_1")
+        self.assertTrue(results[0]["reviewers_added"])
+        self.assertIsNone(results[1])
+
+        calls = manager._sessions[0].calls
+        mutation = calls[1][2]
+        self.assertIn("pr1: createPullRequest(input: $input1)", mutation["query"])
+        self.assertEqual(mutation["variables"]["input0"]["repositoryId"], "R_1")
+        self.assertTrue(calls[2][1].endswith("/pulls/1/requested_reviewers"))
+
+
+    def test_failed_batch_keeps_results_of_earlier_batches(self):
+        mutations = []
+
+        def handler(method, url, payload):
+            if not payload["query"].startswith("mutation"):
+                return make_response(200, {"data": {"repository": {"id": "R_1"}}})
+            mutations.append(payload)
+            if len(mutations) == 2:
+                return make_response(502, {"message": "Bad Gateway"})
+            return make_response(200, {"data": {
+                f"pr{i}": {"pullRequest": {"id": f"PR_{i}", "number": i + 1, "url": f"https://github.com/o/r/pull/{i + 1}"}}
+                for i in range(len(payload["variables"]))
+            }})
+
+        manager = make_manager(handler)
+        specs = [{"title": str(i), "head": f"h{i}", "base": "main"} for i in range(30)]
+        results = manager.create_pull_requests_graphql(specs)
+
+        self.assertEqual(len(results), 30)
+        self.assertTrue(all(r is not None for r in results[:25]))
+        self.assertEqual(results[25:], [None] * 5)
+
+    def test_mutation_is_not_retried_on_5xx(self):
+        manager = GitHubPRManager(TOKEN, "owner", "repo")
+        retry = manager._no_retry_sessions[0].get_adapter("https://api.github.com").max_retries
+
+        self.assertEqual(tuple(retry.status_forcelist), ())
+        self.assertFalse(retry.read)
+        self.assertIsNot(manager._no_retry_sessions[0], manager._sessions[0])
+        manager.close()
+
+    def test_empty_specs_send_no_request(self):
+        manager = make_manager(lambda method, url, payload: self.fail("unexpected request"))
+
+        self.assertEqual(manager.create_pull_requests_graphql([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()